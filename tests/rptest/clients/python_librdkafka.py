@@ -6,6 +6,7 @@
 # As of the Change Date specified in that file, in accordance with
 # the Business Source License, use of this software will be governed
 # by the Apache License, Version 2.0
+from confluent_kafka import KafkaException
 from confluent_kafka.admin import AdminClient, NewTopic
 from rptest.clients.types import TopicSpec
 
@@ -24,6 +25,7 @@ class PythonLibrdkafka:
         self._username = username
         self._password = password
         self._algorithm = algorithm
+        self._admin = None
 
     def brokers(self):
         client = AdminClient(self._get_config())
@@ -34,13 +36,23 @@ class PythonLibrdkafka:
         return client.list_topics(timeout=10).topics
 
     def create_topic(self, spec):
-        topics = [
-            NewTopic(spec.name,
-                     num_partitions=spec.partition_count,
-                     replication_factor=spec.replication_factor)
-        ]
-        client = AdminClient(self._get_config())
-        res = client.create_topics(topics, request_timeout=10)
+        self.create_topics([spec])
+
+    def create_topics(self, specs):
+        """
+        Create all topics with a single CreateTopics request.
+        """
+        def make_topic(spec):
+            config = {}
+            if spec.cleanup_policy:
+                config[TopicSpec.PROPERTY_CLEANUP_POLICY] = spec.cleanup_policy
+            return NewTopic(spec.name,
+                            num_partitions=spec.partition_count,
+                            replication_factor=spec.replication_factor,
+                            config=config)
+
+        topics = [make_topic(spec) for spec in specs]
+        res = self._admin_client().create_topics(topics, request_timeout=10)
         for topic, fut in res.items():
             try:
                 fut.result()
@@ -50,6 +62,28 @@ class PythonLibrdkafka:
                     f"topic {topic} creation failed: {e}")
                 raise
 
+    def topics_exist(self, names):
+        """
+        Check that broker metadata reports every topic in names.
+        """
+        client = self._admin_client()
+        for name in names:
+            try:
+                topics = client.list_topics(topic=name, timeout=10).topics
+            except KafkaException as e:
+                self._redpanda.logger.debug(
+                    f"metadata request for topic {name} failed: {e}")
+                return False
+            topic = topics.get(name)
+            if topic is None or topic.error is not None:
+                return False
+        return True
+
+    def _admin_client(self):
+        if self._admin is None:
+            self._admin = AdminClient(self._get_config())
+        return self._admin
+
     def _get_config(self):
         conf = {
             'bootstrap.servers': self._redpanda.brokers(),
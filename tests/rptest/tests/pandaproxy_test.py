@@ -10,6 +10,7 @@
 import http.client
 import json
 import logging
+import os
 import uuid
 import requests
 from ducktape.mark.resource import cluster
@@ -22,7 +23,7 @@ from rptest.tests.redpanda_test import RedpandaTest
 
 
 def create_topic_names(count):
-    return list(f"pandaproxy-topic-{uuid.uuid4()}" for _ in range(count))
+    return [f"pandaproxy-topic-{uuid.uuid4()}" for _ in range(count)]
 
 
 HTTP_GET_TOPICS_HEADERS = {
@@ -127,7 +128,8 @@ class PandaProxyTest(RedpandaTest):
             enable_pp=True,
             extra_rp_conf={"auto_create_topics_enabled": False})
 
-        http.client.HTTPConnection.debuglevel = 1
+        if os.environ.get("RP_HTTP_DEBUG"):
+            http.client.HTTPConnection.debuglevel = 1
         logging.basicConfig()
         requests_log = logging.getLogger("requests.packages.urllib3")
         requests_log.setLevel(logging.getLogger().level)
@@ -137,9 +139,11 @@ class PandaProxyTest(RedpandaTest):
         return f"http://{self.redpanda.nodes[0].account.hostname}:8082"
 
     def _create_topics(self,
-                       names=create_topic_names(1),
+                       names=None,
                        partitions=1,
                        replicas=1):
+        if names is None:
+            names = create_topic_names(1)
         self.logger.debug(f"Creating topics: {names}")
         kafka_tools = KafkaCliTools(self.redpanda)
         for name in names:
@@ -797,7 +801,8 @@ class PandaProxySASLTest(RedpandaTest):
                                                  enable_pp=True,
                                                  extra_rp_conf=extra_rp_conf)
 
-        http.client.HTTPConnection.debuglevel = 1
+        if os.environ.get("RP_HTTP_DEBUG"):
+            http.client.HTTPConnection.debuglevel = 1
         logging.basicConfig()
         requests_log = logging.getLogger("requests.packages.urllib3")
         requests_log.setLevel(logging.getLogger().level)
@@ -10,6 +10,7 @@
 import http.client
 import json
 import logging
+import os
 import uuid
 import requests
 from ducktape.mark.resource import cluster
@@ -18,11 +19,12 @@ from ducktape.utils.util import wait_until
 from rptest.clients.types import TopicSpec
 from rptest.clients.kafka_cat import KafkaCat
 from rptest.clients.kafka_cli_tools import KafkaCliTools
+from rptest.clients.python_librdkafka import PythonLibrdkafka
 from rptest.tests.redpanda_test import RedpandaTest
 
 
 def create_topic_names(count):
-    return list(f"pandaproxy-topic-{uuid.uuid4()}" for _ in range(count))
+    return [f"pandaproxy-topic-{uuid.uuid4()}" for _ in range(count)]
 
 
 HTTP_GET_HEADERS = {"Accept": "application/vnd.schemaregistry.v1+json"}
@@ -50,75 +52,86 @@ class SchemaRegistryTest(RedpandaTest):
             extra_rp_conf={"auto_create_topics_enabled": False},
             num_cores=1)
 
-        http.client.HTTPConnection.debuglevel = 1
+        if os.environ.get("RP_HTTP_DEBUG"):
+            http.client.HTTPConnection.debuglevel = 1
         logging.basicConfig()
         requests_log = logging.getLogger("requests.packages.urllib3")
         requests_log.setLevel(logging.getLogger().level)
         requests_log.propagate = True
 
+        self._session = requests.Session()
+
+    def tearDown(self):
+        self._session.close()
+        super().tearDown()
+
     def _base_uri(self):
         return f"http://{self.redpanda.nodes[0].account.hostname}:8081"
 
-    def _get_topics(self):
-        return requests.get(
-            f"http://{self.redpanda.nodes[0].account.hostname}:8082/topics")
-
     def _create_topics(self,
-                       names=create_topic_names(1),
+                       names=None,
                        partitions=1,
                        replicas=1,
                        cleanup_policy=TopicSpec.CLEANUP_DELETE):
+        if names is None:
+            names = create_topic_names(1)
         self.logger.debug(f"Creating topics: {names}")
-        kafka_tools = KafkaCliTools(self.redpanda)
-        for name in names:
-            kafka_tools.create_topic(
-                TopicSpec(name=name,
-                          partition_count=partitions,
-                          replication_factor=replicas))
-        assert set(names).issubset(self._get_topics().json())
+        client = PythonLibrdkafka(self.redpanda)
+        client.create_topics([
+            TopicSpec(name=name,
+                      partition_count=partitions,
+                      replication_factor=replicas,
+                      cleanup_policy=cleanup_policy) for name in names
+        ])
+        wait_until(lambda: client.topics_exist(names),
+                   timeout_sec=30,
+                   backoff_sec=1,
+                   err_msg="Timeout waiting for topics to appear.")
         return names
 
     def _get_config(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/config", headers=headers)
+        return self._session.get(f"{self._base_uri()}/config", headers=headers)
 
     def _set_config(self, data, headers=HTTP_POST_HEADERS):
-        return requests.put(f"{self._base_uri()}/config",
-                            headers=headers,
-                            data=data)
+        return self._session.put(f"{self._base_uri()}/config",
+                                 headers=headers,
+                                 data=data)
 
     def _get_config_subject(self, subject, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/config/{subject}",
-                            headers=headers)
+        return self._session.get(f"{self._base_uri()}/config/{subject}",
+                                 headers=headers)
 
     def _set_config_subject(self, subject, data, headers=HTTP_POST_HEADERS):
-        return requests.put(f"{self._base_uri()}/config/{subject}",
-                            headers=headers,
-                            data=data)
+        return self._session.put(f"{self._base_uri()}/config/{subject}",
+                                 headers=headers,
+                                 data=data)
 
     def _get_schemas_types(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/schemas/types",
-                            headers=headers)
+        return self._session.get(f"{self._base_uri()}/schemas/types",
+                                 headers=headers)
 
     def _get_schemas_ids_id(self, id, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/schemas/ids/{id}",
-                            headers=headers)
+        return self._session.get(f"{self._base_uri()}/schemas/ids/{id}",
+                                 headers=headers)
 
     def _get_subjects(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/subjects", headers=headers)
+        return self._session.get(f"{self._base_uri()}/subjects",
+                                 headers=headers)
 
     def _post_subjects_subject_versions(self,
                                         subject,
                                         data,
                                         headers=HTTP_POST_HEADERS):
-        return requests.post(f"{self._base_uri()}/subjects/{subject}/versions",
-                             headers=headers,
-                             data=data)
+        return self._session.post(
+            f"{self._base_uri()}/subjects/{subject}/versions",
+            headers=headers,
+            data=data)
 
     def _get_subjects_subject_versions_version(self,
                                                subject,
                                                version,
                                                headers=HTTP_GET_HEADERS):
-        return requests.get(
+        return self._session.get(
             f"{self._base_uri()}/subjects/{subject}/versions/{version}",
             headers=headers)
 
@@ -126,7 +139,7 @@ class SchemaRegistryTest(RedpandaTest):
                                        subject,
                                        deleted=False,
                                        headers=HTTP_GET_HEADERS):
-        return requests.get(
+        return self._session.get(
             f"{self._base_uri()}/subjects/{subject}/versions{'?deleted=true' if deleted else ''}",
             headers=headers)
 
@@ -134,7 +147,7 @@ class SchemaRegistryTest(RedpandaTest):
                         subject,
                         permanent=False,
                         headers=HTTP_GET_HEADERS):
-        return requests.delete(
+        return self._session.delete(
             f"{self._base_uri()}/subjects/{subject}{'?permanent=true' if permanent else ''}",
             headers=headers)
 
@@ -143,7 +156,7 @@ class SchemaRegistryTest(RedpandaTest):
                                 version,
                                 permanent=False,
                                 headers=HTTP_GET_HEADERS):
-        return requests.delete(
+        return self._session.delete(
             f"{self._base_uri()}/subjects/{subject}/versions/{version}{'?permanent=true' if permanent else ''}",
             headers=headers)
 
@@ -152,11 +165,30 @@ class SchemaRegistryTest(RedpandaTest):
                                             version,
                                             data,
                                             headers=HTTP_POST_HEADERS):
-        return requests.post(
+        return self._session.post(
             f"{self._base_uri()}/compatibility/subjects/{subject}/versions/{version}",
             headers=headers,
             data=data)
 
+    @cluster(num_nodes=3)
+    def test_create_topics(self):
+        """
+        Verify topics created by the test helper carry the requested config
+        """
+        names = create_topic_names(3)
+        self._create_topics(names,
+                            partitions=3,
+                            replicas=3,
+                            cleanup_policy=TopicSpec.CLEANUP_COMPACT)
+
+        kafka_tools = KafkaCliTools(self.redpanda)
+        for name in names:
+            spec = kafka_tools.describe_topic(name)
+            assert spec == TopicSpec(name=name,
+                                     partition_count=3,
+                                     replication_factor=3,
+                                     cleanup_policy=TopicSpec.CLEANUP_COMPACT)
+
     @cluster(num_nodes=3)
     def test_schemas_types(self):
         """